@@ -1,56 +1,680 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import os
 import sys
-from typing import Optional
-
-import serial
-from serial.tools import list_ports
+import threading
+import time
+from typing import Callable, Iterable, NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Enumeration walks the OS device database (sysfs on Linux, SetupAPI on Windows) with
+# dozens of syscalls per port and verification opens every port, so back-to-back calls
+# from polling scripts reuse the last result for a few seconds
+_CACHE_TTL = 2.0
+_results_cache: dict[tuple[bool, float], tuple[float, list[tuple[str, str]]]] = {}
+
+# Evaluated once at import instead of on every probe
+_IS_POSIX = os.name == "posix"
+_IS_LINUX = sys.platform.startswith("linux")
+_IS_DARWIN = sys.platform == "darwin"
+
+# O_NOCTTY keeps the port from becoming our controlling terminal, O_NONBLOCK keeps
+# open() from waiting for carrier detect. Windows defines neither
+_NONBLOCKING_OPEN_FLAGS = os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK if _IS_POSIX else 0
+
+_DEV_DIR = "/dev"
+_SYS_CLASS_TTY = "/sys/class/tty"
+
+# Device node prefixes that pyserial's list_ports backends report on each platform
+_LINUX_PORT_PREFIXES = ("ttyS", "ttyUSB", "ttyXRUSB", "ttyACM", "ttyAMA", "rfcomm", "ttyAP")
+_DARWIN_PORT_PREFIXES = ("cu.",)
+
+# Subsystems whose ports pyserial describes by their name instead of USB metadata
+_NAMED_SUBSYSTEMS = ("pnp", "amba")
+
+# Extra time on top of the open timeout before a pyserial probe is abandoned, so a
+# driver stuck in open()/close() cannot stall the caller indefinitely
+_PROBE_GRACE = 0.5
+
+# Upper bound on probe threads started by a single call, so hosts with hundreds of
+# virtual COM ports do not get hundreds of threads
+_MAX_PROBE_THREADS = 32
+
+# Devices whose probe thread is still running. Abandoned probes are never joined, so
+# later calls skip these ports instead of piling up threads on the same stuck driver
+_probing: set[str] = set()
+_probing_lock = threading.Lock()
+
+
+class _PortInfo(NamedTuple):
+    """The subset of pyserial's ListPortInfo that listserial uses"""
+
+    device: str
+    description: str
+
 
 def serial_ports(
-    timeout: float = 1.0, verify_access: bool = True
+    timeout: float = 1.0, verify_access: bool = True, force_refresh: bool = False
 ) -> list[tuple[str, str]]:
     """Lists available and accessible serial ports with descriptions
 
+    On Windows, where ports are probed through pyserial, a port whose open() does
+    not return within timeout plus a short grace period is reported as not
+    accessible instead of blocking the call. On POSIX systems the probe is a
+    non-blocking os.open() with no deadline: it skips the carrier-detect wait,
+    but the driver's own open() (e.g., USB control transfers) can still block.
+
+    When verifying access, the first accessible port is remembered in the user
+    cache directory and is probed and listed first on the next call
+
     :param timeout:
-        Timeout in seconds when opening ports for verification (default: 1.0)
+        Timeout in seconds when opening ports for verification (default: 1.0).
+        Only the pyserial probe used on Windows honours it; the POSIX probe opens
+        ports non-blocking and ignores it
     :param verify_access:
-        If True, only returns ports that can be opened. If False, returns all detected ports (default: True)
+        If True, only returns ports that can be opened. If False, returns all detected ports
+        without opening them; on macOS they are read straight from /dev and have an empty
+        description (default: True)
+    :param force_refresh:
+        If True, enumerates and verifies the ports again even if a result from the
+        last 2 seconds is cached (default: False)
     :raises EnvironmentError:
         On unsupported or unknown platforms
     :returns:
         A list of tuples (port_name, description) of the serial ports on the system
     """
-    ports = list(list_ports.comports())
-    result: list[tuple[str, str]] = []
-
-    for port in ports:
-        # PySerial returns None for ports without metadata (e.g., some USB adapters)
-        # Normalize to empty string to maintain consistent type and avoid errors in client code
-        description = port.description if port.description is not None else ""
-        
-        if verify_access:
-            # Opening the port is the only reliable way to verify actual accessibility
-            # The system may list ports that are locked by other processes (Arduino IDE, minicom, etc.)
-            # or require special permissions (e.g., not being in dialout group on Linux)
-            try:
-                with serial.Serial(port.device, timeout=timeout):
-                    result.append((port.device, description))
-            # OSError captures permission/device issues, SerialException captures port-specific errors
-            # We separate both because they require different solutions (permissions vs hardware)
-            except (OSError, serial.SerialException) as e:
-                logger.debug(
-                    f"Port {port.device} is not accessible: {type(e).__name__}: {e}"
-                )
+    key = (verify_access, timeout)
+    if not force_refresh:
+        cached = _cache_lookup(key)
+        if cached is not None:
+            return cached
+
+    result = _verified_ports(timeout) if verify_access else _unverified_ports()
+    _cache_store(key, result)
+    return list(result)
+
+
+def _verified_ports(timeout: float) -> list[tuple[str, str]]:
+    """Lists the detected ports that can be opened
+
+    :param timeout:
+        Timeout in seconds when opening ports for verification
+    :returns:
+        A list of tuples (port_name, description) of the accessible serial ports
+    """
+    last = _read_last_port()
+    ports = _prefer_port(_comports(), last)
+
+    if _IS_POSIX:
+        # Non-blocking opens normally return as soon as the driver has set up the
+        # port, so one pass in this thread is cheaper than spinning up a thread per
+        # port. There is no deadline here: a driver stuck in open() blocks the pass
+        result = _filter_available(ports, _probe_nonblocking)
+        _remember_last_port(result, last)
+        return result
+
+    if not ports:
+        return []
+
+    # Each pyserial probe blocks on driver I/O for up to `timeout` seconds, so running them
+    # concurrently bounds the total wall time by the slowest port instead of the sum
+    slots: list[tuple[Optional[tuple[str, str]], Optional[Exception]]] = [(None, None)] * len(ports)
+    limit = threading.BoundedSemaphore(_MAX_PROBE_THREADS)
+
+    def store(index: int, entry: Optional[tuple[str, str]], error: Optional[Exception]) -> None:
+        slots[index] = (entry, error)
+        limit.release()
+
+    deadline = time.monotonic() + timeout + _PROBE_GRACE
+    threads: list[Optional[threading.Thread]] = []
+    for index, port in enumerate(ports):
+        thread = None
+        if limit.acquire(timeout=max(0.0, deadline - time.monotonic())):
+            thread = _start_probe_thread(port, timeout, functools.partial(store, index))
+            if thread is None:
+                limit.release()
         else:
-            result.append((port.device, description))
-    
+            logger.debug("No probe thread became free for port %s before the deadline", port.device)
+        threads.append(thread)
+
+    result = []
+    # Threads are joined in submission order, so the original port order is preserved
+    for index, (port, thread) in enumerate(zip(ports, threads)):
+        if thread is None:
+            continue
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            logger.debug(
+                "Port %s did not open within %s seconds", port.device, timeout + _PROBE_GRACE
+            )
+            continue
+        entry, error = slots[index]
+        if error is not None:
+            raise error
+        if entry is not None:
+            result.append(entry)
+
+    _remember_last_port(result, last)
     return result
 
 
+def _start_probe_thread(
+    port,
+    timeout: float,
+    done: Callable[[Optional[tuple[str, str]], Optional[Exception]], None],
+) -> Optional[threading.Thread]:
+    """Runs _probe for a single port in a daemon thread
+
+    Daemon threads are never joined at interpreter exit, so a driver stuck in
+    open() cannot keep the process alive once its deadline has passed. Pool
+    workers (concurrent.futures, the asyncio default executor) always are.
+    A port whose previous probe is still running is not probed again
+
+    :param port:
+        A ListPortInfo-like object with device and description attributes
+    :param timeout:
+        Timeout in seconds when opening the port
+    :param done:
+        Called from the thread with (entry, None) once the probe returns, or
+        with (None, error) if it raised an unexpected exception
+    :returns:
+        The started thread, or None if the port is still being probed by an
+        earlier thread; done is not called then
+    """
+    with _probing_lock:
+        if port.device in _probing:
+            logger.debug("Port %s is still being probed by an earlier call", port.device)
+            return None
+        _probing.add(port.device)
+
+    def run() -> None:
+        try:
+            try:
+                entry = _probe(port, timeout)
+            finally:
+                with _probing_lock:
+                    _probing.discard(port.device)
+        except Exception as e:
+            done(None, e)
+        else:
+            done(entry, None)
+
+    thread = threading.Thread(target=run, name=f"listserial-probe-{port.device}", daemon=True)
+    thread.start()
+    return thread
+
+
+async def serial_ports_async(
+    timeout: float = 1.0, verify_access: bool = True, force_refresh: bool = False
+) -> list[tuple[str, str]]:
+    """Asynchronous version of serial_ports for use inside an event loop
+
+    Enumeration runs in a worker thread and each probe in its own daemon thread,
+    so the loop is never blocked. A probe is abandoned after timeout plus a short
+    grace period and the port is reported as not accessible; since its thread is
+    never joined, asyncio.run() does not wait for it on shutdown either
+
+    :param timeout:
+        Timeout in seconds when opening ports for verification (default: 1.0).
+        Only the pyserial probe used on Windows honours it; the POSIX probe opens
+        ports non-blocking and ignores it
+    :param verify_access:
+        If True, only returns ports that can be opened. If False, returns all detected ports (default: True)
+    :param force_refresh:
+        If True, enumerates and verifies the ports again even if a result from the
+        last 2 seconds is cached (default: False)
+    :returns:
+        A list of tuples (port_name, description) of the serial ports on the system
+    """
+    key = (verify_access, timeout)
+    if not force_refresh:
+        cached = _cache_lookup(key)
+        if cached is not None:
+            return cached
+
+    if verify_access:
+        # The last-port file is read and written off the loop like enumeration
+        last = await asyncio.to_thread(_read_last_port)
+        ports = _prefer_port(await asyncio.to_thread(_comports), last)
+        # gather preserves argument order, so the original port order is kept
+        limit = asyncio.Semaphore(_MAX_PROBE_THREADS)
+        probed = await asyncio.gather(*(_probe_async(port, timeout, limit) for port in ports))
+        result = [entry for entry in probed if entry is not None]
+        await asyncio.to_thread(_remember_last_port, result, last)
+    else:
+        result = await asyncio.to_thread(_unverified_ports)
+
+    _cache_store(key, result)
+    return list(result)
+
+
+def _cache_lookup(key: tuple[bool, float]) -> Optional[list[tuple[str, str]]]:
+    """Returns a copy of the cached result for key if it is recent enough
+
+    :param key:
+        Tuple (verify_access, timeout) the result was computed with
+    :returns:
+        A copy of the cached list, or None if there is no fresh entry
+    """
+    entry = _results_cache.get(key)
+    # Monotonic clock so wall-clock adjustments (NTP, DST) cannot extend or expire entries
+    if entry is None or time.monotonic() - entry[0] >= _CACHE_TTL:
+        return None
+    # Copied so a caller mutating its list cannot alter what later calls receive
+    return list(entry[1])
+
+
+def _cache_store(key: tuple[bool, float], result: list[tuple[str, str]]) -> None:
+    """Caches a result computed with key
+
+    :param key:
+        Tuple (verify_access, timeout) the result was computed with
+    :param result:
+        The list of tuples (port_name, description) to cache
+    """
+    _results_cache[key] = (time.monotonic(), result)
+
+
+async def _probe_async(
+    port, timeout: float, limit: asyncio.Semaphore
+) -> Optional[tuple[str, str]]:
+    """Runs _probe in a daemon thread, giving up once its deadline has passed
+
+    The loop's default executor is avoided on purpose: asyncio.run() joins it
+    on shutdown, which would wait for a hung probe after all
+
+    :param port:
+        A ListPortInfo-like object with device and description attributes
+    :param timeout:
+        Timeout in seconds when opening the port
+    :param limit:
+        Probe threads available to the call, released when a probe returns
+    :returns:
+        A tuple (port_name, description) if the port could be opened in time, None otherwise
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout + _PROBE_GRACE
+    try:
+        await asyncio.wait_for(limit.acquire(), timeout=max(0.0, deadline - loop.time()))
+    except asyncio.TimeoutError:
+        logger.debug("No probe thread became free for port %s before the deadline", port.device)
+        return None
+
+    future = loop.create_future()
+
+    def done(entry: Optional[tuple[str, str]], error: Optional[Exception]) -> None:
+        try:
+            loop.call_soon_threadsafe(_settle, future, limit, entry, error)
+        except RuntimeError:
+            # The loop closed after the deadline; nobody is waiting for this probe
+            pass
+
+    if _start_probe_thread(port, timeout, done) is None:
+        limit.release()
+        return None
+    try:
+        return await asyncio.wait_for(future, timeout=max(0.0, deadline - loop.time()))
+    except asyncio.TimeoutError:
+        logger.debug(
+            "Port %s did not open within %s seconds", port.device, timeout + _PROBE_GRACE
+        )
+        return None
+
+
+def _settle(
+    future: asyncio.Future,
+    limit: asyncio.Semaphore,
+    entry: Optional[tuple[str, str]],
+    error: Optional[Exception],
+) -> None:
+    """Frees the probe thread slot and delivers the outcome, unless it was abandoned
+
+    :param future:
+        The future _probe_async is waiting on
+    :param limit:
+        The semaphore the probe thread was started under
+    :param entry:
+        The probe result, if it returned
+    :param error:
+        The unexpected exception raised by the probe, if any
+    """
+    limit.release()
+    # wait_for cancels the future once the deadline passes
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(entry)
+
+
+def _last_port_path() -> str:
+    """Returns the file that remembers the last accessible port
+
+    :returns:
+        $XDG_CACHE_HOME/listserial/last, falling back to ~/.cache/listserial/last
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "listserial", "last")
+
+
+def _read_last_port() -> Optional[str]:
+    """Reads the port that was accessible first on the previous verified listing
+
+    :returns:
+        The port name, or None if nothing was remembered yet
+    """
+    try:
+        with open(_last_port_path()) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _prefer_port(ports: list, device: Optional[str]) -> list:
+    """Moves the port named device to the front, keeping the others in order
+
+    Users tend to reconnect the same adapter, so the port that answered last
+    time is probed and listed first
+
+    :param ports:
+        ListPortInfo-like objects with a device attribute
+    :param device:
+        Name of the port to move first, or None to keep the order
+    :returns:
+        The reordered list
+    """
+    if device is None:
+        return ports
+    # sorted() is stable, so only the preferred port changes position
+    return sorted(ports, key=lambda port: port.device != device)
+
+
+def _remember_last_port(result: list[tuple[str, str]], last: Optional[str]) -> None:
+    """Remembers the first accessible port for the next verified listing
+
+    :param result:
+        The accessible ports, in the order they were listed
+    :param last:
+        The port remembered so far, to skip rewriting an unchanged file
+    """
+    if not result or result[0][0] == last:
+        return
+    path = _last_port_path()
+    # A read-only or missing home must never break the listing itself
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(result[0][0])
+    except OSError as e:
+        logger.debug("Could not remember last port in %s: %s", path, e)
+
+
+def _unverified_ports() -> list[tuple[str, str]]:
+    """Lists the detected ports without opening them
+
+    :returns:
+        A list of tuples (port_name, description) of the serial ports on the system
+    """
+    if _IS_DARWIN:
+        return _scandir_ports()
+
+    return [_port_entry(port) for port in _comports()]
+
+
+def _scandir_ports() -> list[tuple[str, str]]:
+    """Lists the macOS serial device nodes in /dev without importing pyserial
+
+    Matches the callout devices pyserial reports through IOKit, but with a single
+    directory scan that returns every entry name without a stat() per entry
+
+    :returns:
+        A sorted list of tuples (port_name, "")
+    """
+    with os.scandir(_DEV_DIR) as entries:
+        return sorted(
+            (entry.path, "") for entry in entries if entry.name.startswith(_DARWIN_PORT_PREFIXES)
+        )
+
+
+def _comports() -> list:
+    """Enumerates the serial ports known to the OS
+
+    :returns:
+        A list of ListPortInfo-like objects with device and description attributes
+    """
+    if _IS_LINUX:
+        return _linux_comports()
+
+    # Imported here because serial.tools.list_ports pulls in glob, re and the
+    # platform backends, which the CLI should only pay for when it enumerates
+    from serial.tools import list_ports
+
+    # Every pyserial backend already returns a list, so it is used as-is instead of
+    # being copied. It must be a sequence: _prefer_port hands it back unchanged when
+    # no port is remembered, and the pyserial probes index their result slots by it
+    return list_ports.comports()
+
+
+def _linux_comports() -> list[_PortInfo]:
+    """Enumerates Linux serial ports from /dev and sysfs without pyserial
+
+    Reports the same ports and descriptions as pyserial's list_ports_linux, but
+    only reads the sysfs files needed for the description instead of every
+    USB attribute (vid, pid, serial number, manufacturer, location...)
+
+    :returns:
+        A list of _PortInfo grouped by prefix in pyserial's order (ttyS, ttyUSB,
+        ttyXRUSB, ttyACM...), sorted by port number within each group
+    """
+    with os.scandir(_DEV_DIR) as entries:
+        names = sorted(
+            (entry.name for entry in entries if entry.name.startswith(_LINUX_PORT_PREFIXES)),
+            key=_linux_port_key,
+        )
+
+    ports = []
+    for name in names:
+        subsystem = _tty_subsystem(name)
+        # Legacy 8250 UARTs always have ttyS nodes, even with no hardware behind them;
+        # pyserial hides them by their "platform" subsystem, and so do we
+        if subsystem == "platform":
+            continue
+        ports.append(_PortInfo(os.path.join(_DEV_DIR, name), _linux_description(name, subsystem)))
+    return ports
+
+
+def _linux_port_key(name: str) -> tuple[int, int, str]:
+    """Sort key keeping pyserial's prefix groups, numerically ordered inside each
+
+    :param name:
+        Name of the tty (e.g., ttyUSB10), starting with one of _LINUX_PORT_PREFIXES
+    :returns:
+        A tuple (prefix index, port number, name); names without a numeric suffix
+        sort after the numbered ones of their group
+    """
+    # No prefix is a prefix of another, so the first match is the only one
+    prefix = next(p for p in _LINUX_PORT_PREFIXES if name.startswith(p))
+    suffix = name[len(prefix):]
+    number = int(suffix) if suffix.isdigit() else sys.maxsize
+    return (_LINUX_PORT_PREFIXES.index(prefix), number, name)
+
+
+def _tty_subsystem(name: str) -> Optional[str]:
+    """Resolves the sysfs subsystem of a Linux tty (e.g., usb-serial, pnp, platform)
+
+    :param name:
+        Name of the tty (e.g., ttyUSB0)
+    :returns:
+        The subsystem name, or None if the tty has no device in sysfs
+    """
+    try:
+        link = os.readlink(os.path.join(_SYS_CLASS_TTY, name, "device", "subsystem"))
+    except OSError:
+        return None
+    return os.path.basename(link)
+
+
+def _linux_description(name: str, subsystem: Optional[str]) -> str:
+    """Builds the description pyserial would report for a Linux tty
+
+    :param name:
+        Name of the tty (e.g., ttyUSB0)
+    :param subsystem:
+        Sysfs subsystem of the tty, as returned by _tty_subsystem
+    :returns:
+        "product - interface", "product" or the tty name for USB ports, the tty
+        name for PCI/ARM ports, "n/a" otherwise
+    """
+    if subsystem in _NAMED_SUBSYSTEMS:
+        return name
+    if subsystem not in ("usb", "usb-serial"):
+        return "n/a"
+
+    # usb-serial ttys hang below the USB interface, CDC-ACM ttys are the interface itself
+    interface_path = os.path.realpath(os.path.join(_SYS_CLASS_TTY, name, "device"))
+    if subsystem == "usb-serial":
+        interface_path = os.path.dirname(interface_path)
+
+    product = _read_sysfs_line(os.path.dirname(interface_path), "product")
+    interface = _read_sysfs_line(interface_path, "interface")
+    if interface is not None:
+        return f"{product} - {interface}"
+    return product if product is not None else name
+
+
+def _read_sysfs_line(*parts: str) -> Optional[str]:
+    """Reads the first line of a sysfs attribute
+
+    :param parts:
+        Path components joined with os.path.join
+    :returns:
+        The stripped line, or None if the attribute does not exist
+    """
+    try:
+        with open(os.path.join(*parts)) as f:
+            return f.readline().strip()
+    except OSError:
+        return None
+
+
+def _filter_available(ports: Iterable, opener: Callable[[str], bool]) -> list[tuple[str, str]]:
+    """Keeps the ports that opener reports as accessible
+
+    Free of I/O by itself, so the filtering can be tested with plain functions
+
+    :param ports:
+        ListPortInfo-like objects with device and description attributes
+    :param opener:
+        Called with each device name, returns True if the port could be opened
+    :returns:
+        A list of tuples (port_name, description) of the accessible ports, in input order
+    """
+    return [_port_entry(port) for port in ports if opener(port.device)]
+
+
+def _port_entry(port) -> tuple[str, str]:
+    """Converts a ListPortInfo-like object to a (port_name, description) tuple
+
+    :param port:
+        A ListPortInfo-like object with device and description attributes
+    :returns:
+        A tuple (port_name, description)
+    """
+    # PySerial returns None for ports without metadata (e.g., some USB adapters)
+    # Normalize to empty string to maintain consistent type and avoid errors in client code
+    return (port.device, getattr(port, "description", "") or "")
+
+
+def _probe(port, timeout: float) -> Optional[tuple[str, str]]:
+    """Opens a single port to check whether it is accessible
+
+    :param port:
+        A ListPortInfo-like object with device and description attributes
+    :param timeout:
+        Timeout in seconds when opening the port
+    :returns:
+        A tuple (port_name, description) if the port could be opened, None otherwise
+    """
+    # Opening the port is the only reliable way to verify actual accessibility
+    # The system may list ports that are locked by other processes (Arduino IDE, minicom, etc.)
+    # or require special permissions (e.g., not being in dialout group on Linux)
+    # Windows has no O_NOCTTY/O_NONBLOCK and COM ports need the Win32 API, so only
+    # POSIX systems can skip pyserial
+    if _IS_POSIX:
+        accessible = _probe_nonblocking(port.device)
+    else:
+        accessible = _probe_pyserial(port.device, timeout)
+    return _port_entry(port) if accessible else None
+
+
+def _probe_pyserial(device: str, timeout: float) -> bool:
+    """Checks whether a port can be opened through pyserial
+
+    :param device:
+        Name of the port (e.g., COM3)
+    :param timeout:
+        Timeout in seconds when opening the port
+    :returns:
+        True if the port could be opened, False otherwise
+    """
+    import serial
+
+    try:
+        with serial.Serial(device, timeout=timeout):
+            return True
+    # OSError captures permission/device issues, SerialException captures port-specific errors
+    # We separate both because they require different solutions (permissions vs hardware)
+    except (OSError, serial.SerialException) as e:
+        _log_inaccessible(device, e)
+        return False
+
+
+def _probe_nonblocking(device: str) -> bool:
+    """Checks whether a port can be opened without configuring it
+
+    A raw non-blocking open reports the same permission and device errors as
+    serial.Serial, but skips the termios setup (tcgetattr/tcsetattr, baud rate
+    programming) that pyserial performs on every open. Since nothing is written
+    and the line settings are untouched, close() has no output to drain either,
+    which is what makes some drivers hang for up to 30 seconds
+
+    :param device:
+        Path of the device node (e.g., /dev/ttyUSB0)
+    :returns:
+        True if the port could be opened, False otherwise
+    """
+    try:
+        fd = os.open(device, _NONBLOCKING_OPEN_FLAGS)
+    except OSError as e:
+        _log_inaccessible(device, e)
+        return False
+    os.close(fd)
+    return True
+
+
+def _log_inaccessible(device: str, error: Exception) -> None:
+    """Logs why a port was excluded from the accessible ports
+
+    :param device:
+        Name of the port that could not be opened
+    :param error:
+        The exception raised while opening it
+    """
+    # Checked up front so the exception class name is only resolved when debug
+    # logging is on; with every port locked this runs once per port
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Port %s is not accessible: %s: %s", device, type(error).__name__, error
+        )
+
+
 def format_ports_output(ports: list[tuple[str, str]]) -> str:
     """Formats the list of ports as a string for display
     
@@ -62,14 +686,27 @@ def format_ports_output(ports: list[tuple[str, str]]) -> str:
     if not ports:
         return "No serial port is being used"
     
-    lines = ["Available serial ports:\n"]
-    for port, description in ports:
-        port_info = f"* {port}"
-        if description:
-            port_info += f" - {description}"
-        lines.append(port_info)
-    
-    return "\n".join(lines)
+    if len(ports) == 1:
+        # A single adapter is the usual case, and needs no generator for the join
+        body = _format_port(*ports[0])
+    else:
+        body = "\n".join(_format_port(port, description) for port, description in ports)
+
+    return "Available serial ports:\n\n" + body
+
+
+def _format_port(port: str, description: str) -> str:
+    """Formats a single port as a list item
+
+    :param port:
+        Name of the port
+    :param description:
+        Description of the port, may be empty
+    :returns:
+        The list item, e.g. "* COM3 - USB Serial Device" or "* COM3"
+    """
+    # Ports without description must not get a dangling " - " separator
+    return f"* {port} - {description}" if description else f"* {port}"
 
 
 def main() -> int:
@@ -81,9 +718,11 @@ def main() -> int:
     try:
         ports = serial_ports()
         output = format_ports_output(ports)
-        print(output)
+        # One write of the already-joined text; print() would add separator and
+        # end handling on top. The text layer stays so the console encoding is honored
+        sys.stdout.write(output + "\n")
         return 0
     except Exception as e:
-        logger.error(f"Error listing serial ports: {type(e).__name__}: {e}")
+        logger.error("Error listing serial ports: %s: %s", type(e).__name__, e)
         print(f"Error: {e}", file=sys.stderr)
         return 1